@@ -8,10 +8,11 @@ from chronicler.frames.media import TextFrame
 from chronicler.handlers.command import StartCommandHandler, ConfigCommandHandler, StatusCommandHandler
 from tests.mocks.commands import command_frame_factory, coordinator_mock, TEST_METADATA
 
+pytestmark = pytest.mark.asyncio
+
 class TestStartCommandHandler:
     """Test cases for StartCommandHandler."""
 
-    @pytest.mark.asyncio
     async def test_handle_success(self, coordinator_mock, command_frame_factory):
         """Test successful start command handling."""
         handler = StartCommandHandler(coordinator=coordinator_mock)
@@ -24,7 +25,6 @@ class TestStartCommandHandler:
         coordinator_mock.init_storage.assert_awaited_once()
         coordinator_mock.create_topic.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_handle_init_error(self, coordinator_mock, command_frame_factory):
         """Test error handling when initialization fails."""
         handler = StartCommandHandler(coordinator=coordinator_mock)
@@ -35,7 +35,6 @@ class TestStartCommandHandler:
         with pytest.raises(CommandStorageError, match="Failed to initialize storage: Init failed"):
             await handler.handle(frame)
 
-    @pytest.mark.asyncio
     async def test_handle_create_topic_error(self, coordinator_mock, command_frame_factory):
         """Test error handling when topic creation fails."""
         handler = StartCommandHandler(coordinator=coordinator_mock)
@@ -49,7 +48,6 @@ class TestStartCommandHandler:
 class TestConfigCommandHandler:
     """Test cases for ConfigCommandHandler."""
 
-    @pytest.mark.asyncio
     async def test_handle_missing_args(self, coordinator_mock, command_frame_factory):
         """Test handling when arguments are missing."""
         handler = ConfigCommandHandler(coordinator=coordinator_mock)
@@ -59,7 +57,6 @@ class TestConfigCommandHandler:
         with pytest.raises(CommandValidationError, match="Missing required arguments"):
             await handler.handle(frame)
 
-    @pytest.mark.asyncio
     async def test_handle_success(self, coordinator_mock, command_frame_factory):
         """Test successful config command handling."""
         handler = ConfigCommandHandler(coordinator=coordinator_mock)
@@ -77,7 +74,6 @@ class TestConfigCommandHandler:
             repo="user/repo"
         )
 
-    @pytest.mark.asyncio
     async def test_handle_config_error(self, coordinator_mock, command_frame_factory):
         """Test error handling when configuration fails."""
         handler = ConfigCommandHandler(coordinator=coordinator_mock)
@@ -91,7 +87,6 @@ class TestConfigCommandHandler:
         with pytest.raises(CommandStorageError, match="Failed to configure GitHub: Config failed"):
             await handler.handle(frame)
 
-    @pytest.mark.asyncio
     async def test_handle_sync_error(self, coordinator_mock, command_frame_factory):
         """Test error handling when sync fails."""
         handler = ConfigCommandHandler(coordinator=coordinator_mock)
@@ -108,7 +103,6 @@ class TestConfigCommandHandler:
 class TestStatusCommandHandler:
     """Test cases for StatusCommandHandler."""
 
-    @pytest.mark.asyncio
     async def test_handle_not_initialized(self, coordinator_mock, command_frame_factory):
         """Test handling when storage is not initialized."""
         handler = StatusCommandHandler(coordinator=coordinator_mock)
@@ -118,7 +112,6 @@ class TestStatusCommandHandler:
         with pytest.raises(CommandValidationError, match="Storage not initialized"):
             await handler.handle(frame)
 
-    @pytest.mark.asyncio
     async def test_handle_success(self, coordinator_mock, command_frame_factory):
         """Test successful status command handling."""
         handler = StatusCommandHandler(coordinator=coordinator_mock)
@@ -130,7 +123,6 @@ class TestStatusCommandHandler:
         assert "status" in result.content.lower()
         coordinator_mock.sync.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_handle_sync_error(self, coordinator_mock, command_frame_factory):
         """Test error handling when sync fails."""
         handler = StatusCommandHandler(coordinator=coordinator_mock)
@@ -10,6 +10,8 @@ from chronicler.handlers.command import StartCommandHandler, ConfigCommandHandle
 from chronicler.commands.processor import CommandProcessor
 from tests.mocks.commands import command_frame_factory, coordinator_mock, TEST_METADATA
 
+pytestmark = pytest.mark.asyncio
+
 @pytest.fixture
 def coordinator_mock():
     """Create a mock storage coordinator."""
@@ -21,7 +23,6 @@ def coordinator_mock():
     mock.sync = AsyncMock()
     return mock
 
-@pytest.mark.asyncio
 async def test_command_flow(coordinator_mock, command_frame_factory):
     """Test the complete command flow from start to status."""
     # Setup command processor with handlers
@@ -60,7 +61,6 @@ async def test_command_flow(coordinator_mock, command_frame_factory):
     response = await processor.process(status_frame)
     assert response.content == "Chronicler Status:\n- Storage: Initialized\n- GitHub: Connected\n- Last sync: Success"
 
-@pytest.mark.asyncio
 async def test_command_direct_response_flow(coordinator_mock, command_frame_factory):
     """Test the direct response flow without queueing and command context management."""
     # Setup command processor with handlers
@@ -95,7 +95,6 @@ async def test_command_direct_response_flow(coordinator_mock, command_frame_fact
     # Verify coordinator was called
     coordinator_mock.set_github_config.assert_awaited_once_with("test/repo", "dummy_token")
 
-@pytest.mark.asyncio
 async def test_command_interruption_flow(coordinator_mock, command_frame_factory):
     """Test command interruption and context clearing in the pipeline."""
     processor = CommandProcessor(coordinator=coordinator_mock)
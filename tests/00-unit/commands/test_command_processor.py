@@ -1,6 +1,5 @@
 """Tests for command processor."""
 import pytest
-import pytest_asyncio
 from unittest.mock import Mock, AsyncMock, MagicMock
 from typing import Optional
 import asyncio
@@ -28,7 +27,7 @@ def mock_handler():
         return TextFrame(content="test response", metadata=frame.metadata)
     return handler
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def storage():
     """Create a mock storage coordinator."""
     storage = AsyncMock()
@@ -15,6 +15,8 @@ from chronicler.handlers.command import (
 )
 from tests.mocks.commands import command_frame_factory, coordinator_mock, TEST_METADATA
 
+pytestmark = pytest.mark.asyncio
+
 # Test metadata for all tests
 TEST_METADATA = {
     "sender_id": "123",
@@ -36,7 +38,6 @@ def mock_storage():
 class TestStartCommandHandler:
     """Tests for StartCommandHandler."""
     
-    @pytest.mark.asyncio
     async def test_start_command_success(self, mock_storage):
         """Test successful /start command handling."""
         handler = StartCommandHandler(coordinator=mock_storage)
@@ -50,7 +51,6 @@ class TestStartCommandHandler:
         mock_storage.create_topic.assert_awaited_once()
         mock_storage.save_message.assert_awaited_once_with(frame)
     
-    @pytest.mark.asyncio
     async def test_start_command_already_initialized(self, mock_storage):
         """Test /start when already initialized."""
         handler = StartCommandHandler(mock_storage)
@@ -63,7 +63,6 @@ class TestStartCommandHandler:
         
         mock_storage.init_storage.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_start_command_storage_error(self, mock_storage):
         """Test /start with storage error."""
         handler = StartCommandHandler(mock_storage)
@@ -77,7 +76,6 @@ class TestStartCommandHandler:
 class TestConfigCommandHandler:
     """Tests for ConfigCommandHandler."""
     
-    @pytest.mark.asyncio
     async def test_config_command_success(self, mock_storage):
         """Test successful /config command handling."""
         handler = ConfigCommandHandler(coordinator=mock_storage)
@@ -95,30 +93,22 @@ class TestConfigCommandHandler:
         assert "GitHub configuration updated" in response.content
         assert "username/repo" in response.content
     
-    @pytest.mark.asyncio
-    async def test_config_command_invalid_repo(self, mock_storage):
-        """Test /config command with invalid repository URL."""
-        handler = ConfigCommandHandler(coordinator=mock_storage)
-        mock_storage.is_initialized.return_value = True
-        frame = CommandFrame(command="/config", args=["invalid_url", "ghp_token"], metadata=TEST_METADATA)
-        
-        with pytest.raises(CommandValidationError, match="Repository must be in format 'username/repository'"):
-            await handler.handle(frame)
-    
-    @pytest.mark.asyncio
-    async def test_config_command_invalid_token(self, mock_storage):
-        """Test /config command with invalid token."""
+    @pytest.mark.parametrize("args,message", [
+        pytest.param(["invalid_url", "ghp_token"], "Repository must be in format 'username/repository'", id="invalid_repo"),
+        pytest.param(["username/repo", "invalid_token"], "Token must be a GitHub Personal Access Token", id="invalid_token"),
+    ])
+    async def test_config_command_invalid_args(self, mock_storage, args, message):
+        """Test /config command with an invalid repository URL or token."""
         handler = ConfigCommandHandler(coordinator=mock_storage)
         mock_storage.is_initialized.return_value = True
-        frame = CommandFrame(command="/config", args=["username/repo", "invalid_token"], metadata=TEST_METADATA)
+        frame = CommandFrame(command="/config", args=args, metadata=TEST_METADATA)
         
-        with pytest.raises(CommandValidationError, match="Token must be a GitHub Personal Access Token"):
+        with pytest.raises(CommandValidationError, match=message):
             await handler.handle(frame)
 
 class TestStatusCommandHandler:
     """Tests for StatusCommandHandler."""
     
-    @pytest.mark.asyncio
     async def test_status_command_success(self, mock_storage):
         """Test /status command when storage is initialized."""
         handler = StatusCommandHandler(mock_storage)
@@ -136,7 +126,6 @@ class TestStatusCommandHandler:
         assert "GitHub: Connected" in response.content
         assert response.metadata == TEST_METADATA
     
-    @pytest.mark.asyncio
     async def test_status_command_not_initialized(self, mock_storage):
         """Test /status command when storage is not initialized."""
         handler = StatusCommandHandler(mock_storage)
@@ -147,7 +136,6 @@ class TestStatusCommandHandler:
         
         mock_storage.sync.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_status_command_sync_error(self, mock_storage):
         """Test /status when sync fails."""
         handler = StatusCommandHandler(mock_storage)
@@ -5,8 +5,7 @@ from chronicler.frames.media import TextFrame, ImageFrame
 from chronicler.frames.command import CommandFrame
 from chronicler.frames.base import Frame
 
-@pytest.mark.asyncio
-async def test_frame_metadata_validation():
+def test_frame_metadata_validation():
     """Test frame metadata validation."""
     # Test None metadata
     frame = TextFrame(content="test")  # Should initialize with default metadata
@@ -23,8 +22,7 @@ async def test_frame_metadata_validation():
     expected["type"] = "textframe"
     assert frame.metadata == expected
 
-@pytest.mark.asyncio
-async def test_text_frame_validation():
+def test_text_frame_validation():
     """Test text frame validation."""
     # Test None content
     with pytest.raises(TypeError, match="content must be a string"):
@@ -34,8 +32,7 @@ async def test_text_frame_validation():
     with pytest.raises(TypeError, match="content must be a string"):
         TextFrame(content=123)
 
-@pytest.mark.asyncio
-async def test_image_frame_validation():
+def test_image_frame_validation():
     """Test image frame validation."""
     # Test None content
     with pytest.raises(TypeError, match="content must be bytes"):
@@ -53,8 +50,7 @@ async def test_image_frame_validation():
     with pytest.raises(TypeError, match="format must be a string"):
         ImageFrame(content=b"test", format=123)
 
-@pytest.mark.asyncio
-async def test_command_frame_validation():
+def test_command_frame_validation():
     """Test command frame validation."""
     # Test command without leading slash
     with pytest.raises(ValueError, match="Command must start with '/'"):
@@ -72,8 +68,7 @@ async def test_command_frame_validation():
     with pytest.raises(TypeError, match="All command arguments must be strings"):
         CommandFrame(command="/test", args=[123])
 
-@pytest.mark.asyncio
-async def test_frame_metadata_immutability():
+def test_frame_metadata_immutability():
     """Test that frame metadata can be updated."""
     frame = TextFrame(content="test", metadata={"chat_id": 123})
     
@@ -83,8 +78,7 @@ async def test_frame_metadata_immutability():
     assert frame.metadata["chat_id"] == 123
     assert frame.metadata["type"] == "textframe"
 
-@pytest.mark.asyncio
-async def test_frame_content_access():
+def test_frame_content_access():
     """Test that frame content can be accessed and modified."""
     frame = TextFrame(content="test")
     
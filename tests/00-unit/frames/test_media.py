@@ -11,17 +11,25 @@ def test_text_frame_valid():
     assert frame.content == "test message"
     assert frame.metadata == {"type": "textframe"}
 
-def test_text_frame_invalid_content():
-    """Test TextFrame with invalid content type."""
-    with pytest.raises(TypeError, match="content must be a string"):
-        TextFrame(content=123)
-
 def test_text_frame_with_metadata():
     """Test TextFrame with metadata."""
     metadata = {"chat_id": 123, "message_id": 456}
     frame = TextFrame(content="test", metadata=metadata)
     assert frame.metadata == metadata
 
+@pytest.mark.parametrize("frame_cls,content,kwargs,message", [
+    pytest.param(TextFrame, 123, {}, "content must be a string", id="text"),
+    pytest.param(ImageFrame, "not bytes", {}, "content must be bytes", id="image"),
+    pytest.param(DocumentFrame, "not bytes", {"filename": "test.txt", "mime_type": "text/plain"}, "content must be bytes", id="document"),
+    pytest.param(AudioFrame, "not bytes", {"duration": 120, "mime_type": "audio/mp3"}, "content must be bytes", id="audio"),
+    pytest.param(VoiceFrame, "not bytes", {"duration": 30, "mime_type": "audio/ogg"}, "content must be bytes", id="voice"),
+    pytest.param(StickerFrame, "not bytes", {}, "content must be bytes", id="sticker"),
+])
+def test_media_frame_invalid_content(frame_cls, content, kwargs, message):
+    """Test media frames with invalid content type."""
+    with pytest.raises(TypeError, match=message):
+        frame_cls(content=content, **kwargs)
+
 def test_image_frame_valid():
     """Test valid ImageFrame initialization."""
     frame = ImageFrame(
@@ -44,11 +52,6 @@ def test_image_frame_minimal():
     assert frame.format is None
     assert frame.caption is None
 
-def test_image_frame_invalid_content():
-    """Test ImageFrame with invalid content type."""
-    with pytest.raises(TypeError, match="content must be bytes"):
-        ImageFrame(content="not bytes")
-
 def test_image_frame_invalid_size():
     """Test ImageFrame with invalid size."""
     with pytest.raises(TypeError, match="size must be a tuple of two integers"):
@@ -94,11 +97,6 @@ def test_document_frame_minimal():
     assert frame.mime_type == "text/plain"
     assert frame.caption is None
 
-def test_document_frame_invalid_content():
-    """Test DocumentFrame with invalid content type."""
-    with pytest.raises(TypeError, match="content must be bytes"):
-        DocumentFrame(content="not bytes", filename="test.txt", mime_type="text/plain")
-
 def test_document_frame_invalid_filename():
     """Test DocumentFrame with invalid filename."""
     with pytest.raises(TypeError, match="filename must be a string"):
@@ -130,11 +128,6 @@ def test_audio_frame_valid():
     assert frame.duration == 120
     assert frame.mime_type == "audio/mp3"
 
-def test_audio_frame_invalid_content():
-    """Test AudioFrame with invalid content type."""
-    with pytest.raises(TypeError, match="content must be bytes"):
-        AudioFrame(content="not bytes", duration=120, mime_type="audio/mp3")
-
 def test_audio_frame_invalid_duration():
     """Test AudioFrame with invalid duration."""
     with pytest.raises(TypeError, match="duration must be an integer"):
@@ -158,11 +151,6 @@ def test_voice_frame_valid():
     assert frame.duration == 30
     assert frame.mime_type == "audio/ogg"
 
-def test_voice_frame_invalid_content():
-    """Test VoiceFrame with invalid content type."""
-    with pytest.raises(TypeError, match="content must be bytes"):
-        VoiceFrame(content="not bytes", duration=30, mime_type="audio/ogg")
-
 def test_voice_frame_invalid_duration():
     """Test VoiceFrame with invalid duration."""
     with pytest.raises(TypeError, match="duration must be an integer"):
@@ -196,11 +184,6 @@ def test_sticker_frame_minimal():
     assert frame.set_name is None
     assert frame.format is None
 
-def test_sticker_frame_invalid_content():
-    """Test StickerFrame with invalid content type."""
-    with pytest.raises(TypeError, match="content must be bytes"):
-        StickerFrame(content="not bytes")
-
 def test_sticker_frame_invalid_emoji():
     """Test StickerFrame with invalid emoji."""
     with pytest.raises(TypeError, match="emoji must be a string"):
@@ -19,7 +19,8 @@ from chronicler.exceptions import TransportAuthenticationError
 from tests.mocks.commands import coordinator_mock
 from tests.mocks.transports.telegram import mock_telegram_bot, MockApplicationBuilder
 
-@pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio
+
 async def test_run_bot_initialization(mock_telegram_bot):
     pytest.skip()
     """Test successful bot initialization and shutdown sequence.
@@ -57,7 +58,6 @@ async def test_run_bot_initialization(mock_telegram_bot):
     mock_telegram_bot['app'].stop.assert_called_once()
     mock_telegram_bot['app'].shutdown.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_run_bot_error_handling(mock_telegram_bot):
     pytest.skip()
     """Test error handling during bot initialization."""
@@ -69,7 +69,6 @@ async def test_run_bot_error_handling(mock_telegram_bot):
     with pytest.raises(TransportAuthenticationError, match="Failed to initialize bot: The token `invalid_token` was rejected by the server."):
         await run_bot(token, str(storage_path))
 
-@pytest.mark.asyncio
 async def test_signal_handling(mock_telegram_bot):
     pytest.skip()
     """Test signal handling during bot operation."""
@@ -97,7 +96,6 @@ async def test_signal_handling(mock_telegram_bot):
     mock_telegram_bot['app'].stop.assert_called_once()
     mock_telegram_bot['app'].shutdown.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_graceful_shutdown(mock_telegram_bot):
     pytest.skip()
     """Test graceful shutdown of bot components."""
@@ -126,7 +124,6 @@ async def test_graceful_shutdown(mock_telegram_bot):
     mock_telegram_bot['app'].stop.assert_called_once()
     mock_telegram_bot['app'].shutdown.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_main_function(mock_telegram_bot):
     pytest.skip()
     """Test main function with valid arguments."""
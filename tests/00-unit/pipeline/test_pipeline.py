@@ -1,20 +1,12 @@
 """Tests for pipeline."""
 import pytest
-from unittest.mock import create_autospec, AsyncMock
+from unittest.mock import create_autospec
 from chronicler.frames.media import TextFrame
 from chronicler.pipeline.pipeline import Pipeline
 from chronicler.processors.base import BaseProcessor
 from chronicler.commands.processor import CommandProcessor
 from chronicler.frames.command import CommandFrame
-
-@pytest.fixture
-def processor_mock():
-    """Create a mock processor factory."""
-    def create_mock():
-        processor = create_autospec(BaseProcessor)
-        processor.process = AsyncMock(return_value=TextFrame(content="mock_processed", metadata={}))
-        return processor
-    return create_mock
+from tests.mocks.processors import processor_mock
 
 @pytest.fixture
 def coordinator_mock():
@@ -22,8 +14,7 @@ def coordinator_mock():
     coordinator = create_autospec(BaseProcessor)
     return coordinator
 
-@pytest.mark.asyncio
-async def test_pipeline_creation():
+def test_pipeline_creation():
     """Test creating a pipeline instance."""
     pipeline = Pipeline()
     assert len(pipeline.processors) == 0
@@ -52,8 +43,7 @@ async def test_empty_pipeline():
     result = await pipeline.process(frame)
     assert result == frame
 
-@pytest.mark.asyncio
-async def test_invalid_processor_type():
+def test_invalid_processor_type():
     """Test adding an invalid processor type."""
     pipeline = Pipeline()
     with pytest.raises(TypeError):
@@ -144,8 +144,7 @@ class NullProcessor(BaseProcessor):
     async def process(self, frame: Frame):
         return None
 
-@pytest.mark.asyncio
-async def test_base_processor_logging():
+def test_base_processor_logging():
     """Test that BaseProcessor initialization is logged."""
     with patch('chronicler.processors.base.logger') as mock_logger:
         processor = TestProcessor()
@@ -187,8 +186,7 @@ async def test_processor_chain_null_processor():
     result = await chain.process(frame)
     assert result is None
 
-@pytest.mark.asyncio
-async def test_processor_chain_add_processor():
+def test_processor_chain_add_processor():
     """Test adding a processor to the chain."""
     chain = ProcessorChain()
     with patch('chronicler.processors.base.logger') as mock_logger:
@@ -199,8 +197,7 @@ async def test_processor_chain_add_processor():
             call('PROC - Added processor TestProcessor to chain')
         ])
 
-@pytest.mark.asyncio
-async def test_processor_chain_logging():
+def test_processor_chain_logging():
     """Test ProcessorChain initialization logging."""
     processors = [TestProcessor(), TestProcessor()]
     with patch('chronicler.processors.base.logger') as mock_logger:
@@ -13,7 +13,8 @@ from chronicler.logging import configure_logging, get_logger
 from tests.mocks.transports.telegram import mock_telegram_bot
 from chronicler.logging.config import CORRELATION_ID
 
-@pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio
+
 async def test_correlation_flow(mock_telegram_bot, tmp_path, caplog, capsys):
     """Test correlation ID propagation through transport -> command -> storage chain."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
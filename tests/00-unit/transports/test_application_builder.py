@@ -5,13 +5,24 @@ from telegram.ext import ApplicationBuilder, CommandHandler, ExtBot
 from telegram.error import InvalidToken
 from typing import Optional, Tuple, Dict
 from telegram.request import RequestData, BaseRequest
-import json
+import orjson
 from telegram import Bot
-import asyncio
+from types import SimpleNamespace
 
 from chronicler.exceptions import TransportError
 from chronicler.transports.telegram.transport.bot import TelegramBotTransport
 
+_GET_ME_RESULT = {
+    "id": 123456789,
+    "is_bot": True,
+    "first_name": "Test Bot",
+    "username": "test_bot",
+    "can_join_groups": True,
+    "can_read_all_group_messages": True,
+    "supports_inline_queries": False
+}
+_GET_ME_PAYLOAD = orjson.dumps({"ok": True, "result": _GET_ME_RESULT})
+
 # Create a custom builder that returns our mock
 class MockBuilder:
     """Mock ApplicationBuilder for testing."""
@@ -62,7 +73,7 @@ class MockHTTPXRequest(BaseRequest):
         pool_timeout: Optional[float] = None,
     ) -> bytes:
         """Mock request wrapper that always returns success."""
-        return json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
+        return _GET_ME_PAYLOAD
 
     async def do_request(
         self,
@@ -75,11 +86,11 @@ class MockHTTPXRequest(BaseRequest):
         pool_timeout: Optional[float] = None,
     ) -> Tuple[int, bytes]:
         """Mock request that returns success."""
-        return 200, json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
+        return 200, _GET_ME_PAYLOAD
 
     def parse_json_payload(self, payload: bytes) -> Dict:
         """Parse JSON payload."""
-        return json.loads(payload.decode())
+        return orjson.loads(payload)
 
     async def post(
         self,
@@ -91,24 +102,19 @@ class MockHTTPXRequest(BaseRequest):
         pool_timeout: Optional[float] = None,
     ) -> bytes:
         """Mock post request that returns success."""
-        return json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
+        return _GET_ME_PAYLOAD
+
+# Stateless, so one instance serves every bot in this module
+_SHARED_REQUEST = MockHTTPXRequest()
 
 class MockBot:
     """Mock Bot class that uses our mock request objects."""
     def __init__(self, token: str, **kwargs):
         self.token = token
-        self._request = [MockHTTPXRequest(), MockHTTPXRequest()]  # Use the same request object for both slots
+        self._request = [_SHARED_REQUEST, _SHARED_REQUEST]  # Use the same request object for both slots
         self._initialized = False
         self._app = None
-        self._me = {
-            "id": 123456789,
-            "is_bot": True,
-            "first_name": "Test Bot",
-            "username": "test_bot",
-            "can_join_groups": True,
-            "can_read_all_group_messages": True,
-            "supports_inline_queries": False
-        }
+        self._me = _GET_ME_RESULT
         self._LOGGER = MagicMock()  # Add logger mock
 
     async def initialize(self) -> None:
@@ -116,7 +122,8 @@ class MockBot:
         if self._initialized:
             self._LOGGER.debug("This Bot is already initialized.")
             return
-        await asyncio.gather(self._request[0].initialize(), self._request[1].initialize())
+        await self._request[0].initialize()
+        await self._request[1].initialize()
         await self.get_me()  # Ensure get_me succeeds
         self._initialized = True
 
@@ -145,11 +152,44 @@ class MockBot:
         return True
 
     def __getattr__(self, name):
-        """Mock any other attributes/methods that might be called."""
-        return AsyncMock()
+        """Delegate other Bot attributes to a Bot-specced mock, memoized per instance."""
+        if name == "_spec_mock":
+            # Speccing against Bot walks its whole API, so only bots that need it pay for it
+            value = MagicMock(spec=Bot)  # Coroutine methods of Bot become AsyncMocks
+        else:
+            value = getattr(self._spec_mock, name)
+        object.__setattr__(self, name, value)
+        return value
+
+class MockBotApplicationBuilder:
+    """ApplicationBuilder stand-in whose apps wrap a MockBot."""
 
-@pytest.mark.asyncio
-async def test_application_builder_basic():
+    def __init__(self):
+        self._token = None
+
+    def token(self, token: str):
+        """Set the token and return self for chaining."""
+        self._token = token
+        return self
+
+    def build(self):
+        """Build and return the mock app."""
+        if not self._token:
+            raise RuntimeError("No bot token was set.")
+
+        app = AsyncMock(spec_set=["initialize", "start", "stop", "shutdown", "bot", "add_handler"])
+        bot = MockBot(self._token)
+        app.bot = bot
+
+        # Make initialize actually call bot's initialize
+        async def initialize():
+            await bot.initialize()
+            await bot.get_me()  # This will succeed because we've mocked get_me
+        app.initialize = AsyncMock(side_effect=initialize)
+
+        return app
+
+def test_application_builder_basic():
     """Test basic ApplicationBuilder functionality."""
     # Create a builder
     builder = ApplicationBuilder()
@@ -165,8 +205,7 @@ async def test_application_builder_basic():
     assert hasattr(app, "start")
     assert app.bot.token == "valid_token"
 
-@pytest.mark.asyncio
-async def test_application_builder_methods():
+def test_application_builder_methods():
     """Test that ApplicationBuilder methods are chainable and affect the built app."""
     builder = ApplicationBuilder()
     
@@ -180,8 +219,7 @@ async def test_application_builder_methods():
     assert app.bot.token == "valid_token"
     # Add assertions for other configured properties
 
-@pytest.mark.asyncio
-async def test_application_builder_invalid_token():
+def test_application_builder_invalid_token():
     """Test that ApplicationBuilder validates tokens."""
     builder = ApplicationBuilder()
     
@@ -207,7 +245,7 @@ async def test_application_builder_mock_setup():
     mock_bot = AsyncMock()
     mock_bot.token = None
     mock_bot._initialized = False
-    mock_bot._request = [MockHTTPXRequest(), MockHTTPXRequest()]  # Add mock request objects
+    mock_bot._request = [_SHARED_REQUEST, _SHARED_REQUEST]  # Add mock request objects
     mock_bot.get_me = AsyncMock(return_value={
         "id": 123456789,
         "first_name": "Test Bot",
@@ -218,8 +256,7 @@ async def test_application_builder_mock_setup():
     })
     mock_bot.initialize = AsyncMock()  # Mock the initialize method
 
-    mock_app = AsyncMock(spec=False)  # spec=False to allow __dict__ updates
-    mock_app.bot = mock_bot
+    mock_app = SimpleNamespace(bot=mock_bot)  # Plain attribute bag; MockBuilder attaches start
     mock_bot._app = mock_app
     
     # Create builder with our mocks
@@ -490,60 +527,12 @@ async def test_application_builder_add_handler_behavior():
 @pytest.mark.asyncio
 async def test_application_builder_transport_flow(monkeypatch):
     """Test our mock setup with the transport's authentication flow."""
-    # Create a mock application builder that uses our MockBot
-    class MockApplicationBuilder:
-        def __init__(self):
-            self._token = None
-
-        def token(self, token: str):
-            """Set the token and return self for chaining."""
-            self._token = token
-            return self
-
-        def build(self):
-            """Build and return the mock app."""
-            if not self._token:
-                raise RuntimeError("No bot token was set.")
-            
-            app = AsyncMock()
-            bot = MockBot(self._token)
-            app.bot = bot
-            app.start = AsyncMock()
-
-            # Make initialize actually call bot's initialize
-            async def initialize():
-                await bot.initialize()
-                await bot.get_me()  # This will succeed because we've mocked get_me
-            app.initialize = AsyncMock(side_effect=initialize)
-
-            return app
-
-    # Create a mock request that always returns success
-    class MockRequest(BaseRequest):
-        async def _request_wrapper(self, *args, **kwargs):
-            return json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
-
-        async def do_request(self, *args, **kwargs):
-            return 200, json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
-
-        async def initialize(self):
-            pass
-
-        async def shutdown(self):
-            pass
-
-        def parse_json_payload(self, payload: bytes) -> Dict:
-            return json.loads(payload.decode())
-
-        async def post(self, *args, **kwargs):
-            return json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
-
     # Patch both the Bot and ApplicationBuilder classes
     monkeypatch.setattr("telegram.Bot", MockBot)
     monkeypatch.setattr("telegram.ext.ExtBot", MockBot)
-    monkeypatch.setattr("telegram.ext.ApplicationBuilder", MockApplicationBuilder)
-    monkeypatch.setattr("telegram.request.HTTPXRequest", MockRequest)
-    monkeypatch.setattr("chronicler.transports.telegram.transport.bot.ApplicationBuilder", MockApplicationBuilder)
+    monkeypatch.setattr("telegram.ext.ApplicationBuilder", MockBotApplicationBuilder)
+    monkeypatch.setattr("telegram.request.HTTPXRequest", MockHTTPXRequest)
+    monkeypatch.setattr("chronicler.transports.telegram.transport.bot.ApplicationBuilder", MockBotApplicationBuilder)
 
     # Create transport with test token
     transport = TelegramBotTransport("test_token")
@@ -3,6 +3,8 @@ import pytest
 from chronicler.transports.base import TransportError
 from chronicler.logging import get_logger
 
+pytestmark = pytest.mark.asyncio
+
 logger = get_logger(__name__, component="test.transport")
 
 @pytest.fixture
@@ -22,7 +24,6 @@ async def raise_transport_error_async(message: str):
     """Helper function that raises a TransportError asynchronously."""
     raise TransportError(message)
 
-@pytest.mark.asyncio
 async def test_simple_error_async(assert_transport_error_async):
     """Test that we can catch an async TransportError cleanly."""
     error_message = "test async error"
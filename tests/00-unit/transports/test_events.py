@@ -1,7 +1,8 @@
 """Unit tests for event abstractions."""
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import MagicMock
 from datetime import datetime
+from types import SimpleNamespace
 
 from chronicler.transports.events import EventMetadata, Update
 from chronicler.transports.telegram_bot_event import TelegramBotEvent
@@ -35,12 +36,13 @@ def test_event_metadata():
 def test_update():
     """Test TelethonEvent wrapper."""
     # Mock Telethon event
-    mock_event = Mock()
-    mock_event.message = Mock(text="/test arg1 arg2", id=123)
-    mock_event.chat_id = 456
-    mock_event.chat = Mock(title="Test Chat")
-    mock_event.sender_id = 789
-    mock_event.sender = Mock(username="testuser", first_name="Test User")
+    mock_event = SimpleNamespace(
+        message=SimpleNamespace(text="/test arg1 arg2", id=123),
+        chat_id=456,
+        chat=SimpleNamespace(title="Test Chat"),
+        sender_id=789,
+        sender=SimpleNamespace(username="testuser", first_name="Test User"),
+    )
     
     event = Update(mock_event)
     
@@ -62,12 +64,13 @@ def test_update():
 def test_telethon_event_missing_sender():
     """Test TelethonEvent with missing sender info."""
     # Mock Telethon event with missing sender
-    mock_event = Mock()
-    mock_event.message = Mock(text="/test", id=123)
-    mock_event.chat_id = 456
-    mock_event.chat = Mock(title=None)
-    mock_event.sender_id = None
-    mock_event.sender = None
+    mock_event = SimpleNamespace(
+        message=SimpleNamespace(text="/test", id=123),
+        chat_id=456,
+        chat=SimpleNamespace(title=None),
+        sender_id=None,
+        sender=None,
+    )
     
     event = Update(mock_event)
     metadata = event.get_metadata()
@@ -79,24 +82,25 @@ def test_telethon_event_missing_sender():
 def test_telegram_bot_event():
     """Test TelegramBotEvent."""
     # Create mock update with all fields
-    mock_message = Mock()
-    mock_message.text = "test message"
-    mock_message.chat.id = 123
-    mock_message.chat.title = "Test Chat"
-    mock_message.from_user.id = 456
-    mock_message.from_user.first_name = "Test User"
-    mock_message.message_id = 789
-    mock_message.date = datetime.fromtimestamp(1234567890)
+    mock_message = SimpleNamespace(
+        text="test message",
+        chat=SimpleNamespace(id=123, title="Test Chat"),
+        from_user=SimpleNamespace(id=456, first_name="Test User"),
+        message_id=789,
+        date=datetime.fromtimestamp(1234567890),
+    )
 
-    mock_update = Mock()
-    mock_update.message = mock_message
-    mock_update.chat_id = 123
-    mock_update.chat_title = "Test Chat"
-    mock_update.sender_id = 456
-    mock_update.sender_name = "Test User"
-    mock_update.message_id = 789
-    mock_update.timestamp = 1234567890.0
-    mock_update.message_text = "test message"
+    mock_update = SimpleNamespace(
+        message=mock_message,
+        chat_id=123,
+        chat_title="Test Chat",
+        sender_id=456,
+        sender_name="Test User",
+        message_id=789,
+        thread_id=None,
+        timestamp=1234567890.0,
+        message_text="test message",
+    )
 
     event = TelegramBotEvent(mock_update)
 
@@ -112,25 +116,26 @@ def test_telegram_bot_event():
 def test_telegram_bot_event_missing_sender():
     """Test TelegramBotEvent with missing sender info."""
     # Create mock update with minimal fields
-    mock_message = Mock()
-    mock_message.text = "test message"
-    mock_message.chat.id = 123
-    mock_message.chat.title = None
-    mock_message.from_user = None
-    mock_message.message_id = 789
-    mock_message.date = datetime.fromtimestamp(1234567890)
-    mock_message.message_thread_id = None
+    mock_message = SimpleNamespace(
+        text="test message",
+        chat=SimpleNamespace(id=123, title=None),
+        from_user=None,
+        message_id=789,
+        date=datetime.fromtimestamp(1234567890),
+        message_thread_id=None,
+    )
 
-    mock_update = Mock()
-    mock_update.message = mock_message
-    mock_update.chat_id = 123
-    mock_update.chat_title = None
-    mock_update.sender_id = None
-    mock_update.sender_name = None
-    mock_update.message_id = 789
-    mock_update.thread_id = None
-    mock_update.timestamp = 1234567890.0
-    mock_update.message_text = "test message"
+    mock_update = SimpleNamespace(
+        message=mock_message,
+        chat_id=123,
+        chat_title=None,
+        sender_id=None,
+        sender_name=None,
+        message_id=789,
+        thread_id=None,
+        timestamp=1234567890.0,
+        message_text="test message",
+    )
 
     event = TelegramBotEvent(mock_update)
 
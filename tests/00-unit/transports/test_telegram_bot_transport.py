@@ -2,17 +2,18 @@
 import pytest
 import asyncio
 from tests.mocks.transports.telegram import mock_telegram_bot
-from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from chronicler.exceptions import TransportError, TransportAuthenticationError
 from chronicler.transports.telegram.transport.bot import TelegramBotTransport
 from chronicler.frames.media import TextFrame, ImageFrame
 from chronicler.frames.command import CommandFrame
-from telegram.ext import CommandHandler
+from telegram.ext import ApplicationBuilder, CommandHandler
 from telegram.error import InvalidToken
 from chronicler.transports.telegram_bot_update import TelegramBotUpdate
 from chronicler.frames.base import Frame
 
-@pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio
+
 async def test_empty_token_initial_state(mock_telegram_bot):
     """Test initial state of transport with empty token."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -21,7 +22,6 @@ async def test_empty_token_initial_state(mock_telegram_bot):
     assert transport._token == ""
     assert transport._app is None
 
-@pytest.mark.asyncio 
 async def test_empty_token_raises_error(mock_telegram_bot):
     """Test that empty token raises expected error during authentication."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -34,7 +34,6 @@ async def test_empty_token_raises_error(mock_telegram_bot):
     except TransportAuthenticationError as e:
         assert str(e) == expected_message
 
-@pytest.mark.asyncio
 async def test_empty_token_state_after_error(mock_telegram_bot):
     """Test transport state after authentication error with empty token."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -47,7 +46,6 @@ async def test_empty_token_state_after_error(mock_telegram_bot):
     assert not transport._initialized
     assert transport._app is None
 
-@pytest.mark.asyncio
 async def test_bot_initialization_after_auth(mock_telegram_bot):
     """Test that bot is properly initialized after successful authentication."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -66,7 +64,6 @@ async def test_bot_initialization_after_auth(mock_telegram_bot):
     assert transport._app.bot is not None
     assert transport._app.bot.token == "test_token"
 
-@pytest.mark.asyncio
 async def test_command_registration_after_auth(mock_telegram_bot):
     """Test that command registration is no longer supported after authentication."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -81,7 +78,6 @@ async def test_command_registration_after_auth(mock_telegram_bot):
     with pytest.raises(NotImplementedError, match="Command registration is no longer supported in Transport"):
         await transport.register_command("test", test_command)
 
-@pytest.mark.asyncio
 async def test_start_without_auth(mock_telegram_bot):
     """Test that starting without authentication raises error."""
     transport = TelegramBotTransport("test_token")
@@ -89,7 +85,6 @@ async def test_start_without_auth(mock_telegram_bot):
     with pytest.raises(TransportAuthenticationError, match="Transport must be authenticated before starting"):
         await transport.start()
 
-@pytest.mark.asyncio
 async def test_start_error_handling(mock_telegram_bot):
     """Test error handling during start."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -102,7 +97,6 @@ async def test_start_error_handling(mock_telegram_bot):
     with pytest.raises(TransportError, match="Failed to start bot: Failed to start"):
         await transport.start()
 
-@pytest.mark.asyncio
 async def test_stop_after_auth(mock_telegram_bot):
     """Test stopping transport after authentication."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -115,7 +109,6 @@ async def test_stop_after_auth(mock_telegram_bot):
     transport._app.stop.assert_called_once()
     transport._app.shutdown.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_send_text_frame(mock_telegram_bot):
     """Test sending a text frame."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -147,7 +140,6 @@ async def test_send_text_frame(mock_telegram_bot):
     # Verify frame metadata was updated
     assert result.metadata["message_id"] == 789
 
-@pytest.mark.asyncio
 async def test_send_unsupported_frame_type(mock_telegram_bot):
     """Test sending an unsupported frame type."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -165,7 +157,6 @@ async def test_send_unsupported_frame_type(mock_telegram_bot):
     with pytest.raises(TransportError, match="Unsupported frame type"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_send_uninitialized(mock_telegram_bot):
     """Test sending when transport is not initialized."""
     transport = TelegramBotTransport("test_token")
@@ -174,7 +165,6 @@ async def test_send_uninitialized(mock_telegram_bot):
     with pytest.raises(RuntimeError, match="Transport not initialized"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_send_missing_chat_id(mock_telegram_bot):
     """Test sending without chat_id."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -187,7 +177,6 @@ async def test_send_missing_chat_id(mock_telegram_bot):
     with pytest.raises(ValueError, match="chat_id is required"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_send_error_handling(mock_telegram_bot):
     """Test error handling during send."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -201,7 +190,6 @@ async def test_send_error_handling(mock_telegram_bot):
     with pytest.raises(TransportError, match="Send failed"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_invalid_command_characters(mock_telegram_bot):
     """Test that command registration with invalid characters is no longer supported."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -219,7 +207,6 @@ async def test_invalid_command_characters(mock_telegram_bot):
         with pytest.raises(NotImplementedError, match="Command registration is no longer supported in Transport"):
             await transport.register_command(cmd, test_command)
 
-@pytest.mark.asyncio
 async def test_duplicate_command_registration(mock_telegram_bot):
     """Test that duplicate command registration is no longer supported."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -239,7 +226,6 @@ async def test_duplicate_command_registration(mock_telegram_bot):
     with pytest.raises(NotImplementedError, match="Command registration is no longer supported in Transport"):
         await transport.register_command("test", command1)
 
-@pytest.mark.asyncio
 async def test_process_frame_without_processor(mock_telegram_bot):
     """Test processing frame without frame processor."""
     transport = TelegramBotTransport("test_token")
@@ -248,7 +234,6 @@ async def test_process_frame_without_processor(mock_telegram_bot):
     result = await transport.process_frame(frame)
     assert result == frame  # Should return unmodified frame
 
-@pytest.mark.asyncio
 async def test_process_frame_with_processor(mock_telegram_bot):
     """Test processing frame with frame processor."""
     transport = TelegramBotTransport("test_token")
@@ -264,7 +249,6 @@ async def test_process_frame_with_processor(mock_telegram_bot):
     result = await transport.process_frame(frame)
     assert result.content == "TEST"
 
-@pytest.mark.asyncio
 async def test_handle_message_error(mock_telegram_bot):
     """Test error handling in message processing."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -289,7 +273,6 @@ async def test_handle_message_error(mock_telegram_bot):
     assert transport._error_count == 1
     transport.send.assert_not_called()
 
-@pytest.mark.asyncio
 async def test_bot_transport_command_not_found(mock_telegram_bot):
     """Test that command handling is no longer supported in TelegramBotTransport."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -302,7 +285,6 @@ async def test_bot_transport_command_not_found(mock_telegram_bot):
     with pytest.raises(NotImplementedError, match="Command registration is no longer supported in Transport"):
         await transport.register_command("test", handler)
 
-@pytest.mark.asyncio
 async def test_handle_command_execution(mock_telegram_bot):
     """Test that command execution is no longer handled by transport."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -324,7 +306,6 @@ async def test_handle_command_execution(mock_telegram_bot):
     with pytest.raises(NotImplementedError, match="Command registration is no longer supported in Transport"):
         await transport.register_command("test", test_command)
 
-@pytest.mark.asyncio
 async def test_authenticate_invalid_token(mock_telegram_bot):
     """Test that authenticating with invalid token raises expected error."""
     transport = TelegramBotTransport("invalid_token")
@@ -336,14 +317,12 @@ async def test_authenticate_invalid_token(mock_telegram_bot):
     assert not transport._initialized
     assert transport._app is None
 
-@pytest.mark.asyncio
 async def test_stop_without_auth(mock_telegram_bot):
     """Test stopping transport that wasn't authenticated."""
     transport = TelegramBotTransport("test_token")
     await transport.stop()  # Should not raise
     assert not transport._initialized 
 
-@pytest.mark.asyncio
 async def test_send_image_frame(mock_telegram_bot):
     """Test sending an image frame with caption."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -381,7 +360,6 @@ async def test_send_image_frame(mock_telegram_bot):
     # Verify frame metadata was updated
     assert result.metadata["message_id"] == 789
 
-@pytest.mark.asyncio
 async def test_send_image_frame_without_caption(mock_telegram_bot):
     """Test sending an image frame without caption."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -414,7 +392,6 @@ async def test_send_image_frame_without_caption(mock_telegram_bot):
     # Verify frame metadata was updated
     assert result.metadata["message_id"] == 789 
 
-@pytest.mark.asyncio
 async def test_frame_processor_returns_none(mock_telegram_bot):
     """Test handling when frame processor returns None."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -441,7 +418,6 @@ async def test_frame_processor_returns_none(mock_telegram_bot):
     await transport._handle_message(TelegramBotUpdate(mock_update))
     transport._app.bot.send_message.assert_not_called()
 
-@pytest.mark.asyncio
 async def test_frame_processor_modifies_metadata(mock_telegram_bot):
     """Test that frame processor can modify frame metadata."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -471,7 +447,6 @@ async def test_frame_processor_modifies_metadata(mock_telegram_bot):
     assert processed.metadata["timestamp"] == "test_time"
     assert processed.metadata["chat_id"] == 123  # Original metadata preserved
 
-@pytest.mark.asyncio
 async def test_frame_processor_chaining(mock_telegram_bot):
     """Test chaining multiple frame processors."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -512,7 +487,6 @@ async def test_frame_processor_chaining(mock_telegram_bot):
     assert processed.metadata["processor1"] is True
     assert processed.metadata["processor2"] is True
 
-@pytest.mark.asyncio
 async def test_frame_processor_error_handling(mock_telegram_bot):
     """Test error handling in frame processor."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -543,7 +517,6 @@ async def test_frame_processor_error_handling(mock_telegram_bot):
     # Error count should be incremented
     assert transport._error_count == 1
 
-@pytest.mark.asyncio
 async def test_frame_processor_chaining_without_app():
     """Test frame processor chaining without initialized app."""
     loop = asyncio.get_running_loop()
@@ -576,7 +549,6 @@ async def test_frame_processor_chaining_without_app():
     processed = await transport.process_frame(frame)
     assert processed.content == "[TEST]"
 
-@pytest.mark.asyncio
 async def test_frame_processor_metadata_manipulation():
     """Test frame processor metadata manipulation without app."""
     loop = asyncio.get_running_loop()
@@ -604,7 +576,6 @@ async def test_frame_processor_metadata_manipulation():
     assert processed.metadata["timestamp"] == "test_time"
     assert processed.metadata["chat_id"] == 123  # Original metadata preserved
 
-@pytest.mark.asyncio
 async def test_frame_validation_without_metadata(mock_telegram_bot):
     """Test frame validation when metadata is None."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -618,7 +589,6 @@ async def test_frame_validation_without_metadata(mock_telegram_bot):
     with pytest.raises(ValueError, match="chat_id is required"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_frame_validation_empty_metadata(mock_telegram_bot):
     """Test frame validation with empty metadata."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -631,7 +601,6 @@ async def test_frame_validation_empty_metadata(mock_telegram_bot):
     with pytest.raises(ValueError, match="chat_id is required"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_frame_type_validation(mock_telegram_bot):
     """Test validation of frame types."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -651,7 +620,6 @@ async def test_frame_type_validation(mock_telegram_bot):
     with pytest.raises(TransportError, match="Unsupported frame type"):
         await transport.send(frame)
 
-@pytest.mark.asyncio
 async def test_error_count_tracking(mock_telegram_bot):
     """Test error count tracking during message processing."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -685,7 +653,6 @@ async def test_error_count_tracking(mock_telegram_bot):
     await transport._handle_message(TelegramBotUpdate(mock_update))
     assert transport._error_count == 2
 
-@pytest.mark.asyncio
 async def test_error_count_tracking_without_app(mock_telegram_bot):
     """Test error count tracking without initialized app."""
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
@@ -716,39 +683,35 @@ async def test_error_count_tracking_without_app(mock_telegram_bot):
     # Error count should be incremented
     assert transport._error_count == 1
 
-@pytest.mark.asyncio
-async def test_authenticate_build_error():
+async def test_authenticate_build_error(monkeypatch):
     """Test error handling when ApplicationBuilder.build() fails with a generic error."""
     loop = asyncio.get_running_loop()
     transport = TelegramBotTransport("test_token")
     
     # Mock ApplicationBuilder to raise an error during build
-    with patch('telegram.ext.ApplicationBuilder.build', side_effect=Exception("Build failed")):
-        with pytest.raises(TransportError, match="Failed to build application: Build failed"):
-            await transport.authenticate()
+    monkeypatch.setattr(ApplicationBuilder, "build", Mock(side_effect=Exception("Build failed")))
+    with pytest.raises(TransportError, match="Failed to build application: Build failed"):
+        await transport.authenticate()
     
     assert not transport.is_running
     assert transport._app is None
 
-@pytest.mark.asyncio
-async def test_authenticate_initialize_error():
+async def test_authenticate_initialize_error(monkeypatch):
     """Test error handling when app.initialize() fails."""
     loop = asyncio.get_running_loop()
     transport = TelegramBotTransport("test_token")
     
     # Create mock app with failing initialize
-    mock_app = AsyncMock()
-    mock_app.initialize = AsyncMock(side_effect=Exception("Initialize failed"))
-    mock_app.bot = AsyncMock()
+    mock_app = AsyncMock(spec_set=["initialize", "bot"])
+    mock_app.initialize.side_effect = Exception("Initialize failed")
     
-    with patch('telegram.ext.ApplicationBuilder.build', return_value=mock_app):
-        with pytest.raises(TransportAuthenticationError, match="Failed to initialize bot: Initialize failed"):
-            await transport.authenticate()
+    monkeypatch.setattr(ApplicationBuilder, "build", Mock(return_value=mock_app))
+    with pytest.raises(TransportAuthenticationError, match="Failed to initialize bot: Initialize failed"):
+        await transport.authenticate()
     
     assert not transport.is_running
     assert transport._app is None
 
-@pytest.mark.asyncio
 async def test_stop_without_initialization():
     """Test stopping a transport that was never initialized."""
     loop = asyncio.get_running_loop()
@@ -760,7 +723,6 @@ async def test_stop_without_initialization():
     assert not transport.is_running
     assert transport._app is None
 
-@pytest.mark.asyncio
 async def test_command_registration_removed():
     """Test that command registration is no longer supported."""
     transport = TelegramBotTransport(token="test_token")
@@ -1,6 +1,5 @@
 """Tests for telegram interaction."""
 import pytest
-import pytest_asyncio
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 from telegram import Bot, Message, Chat, User, Update, PhotoSize
@@ -14,9 +13,10 @@ from tests.mocks.transports.telethon import user_transport, mock_telegram_user_c
 import asyncio
 from chronicler.transports.events import EventMetadata
 
+pytestmark = pytest.mark.asyncio
+
 logger = logging.getLogger(__name__)
 
-@pytest.mark.asyncio
 @trace_operation("test.transport.telegram_interaction")
 async def test_telegram_interaction(bot_transport, user_transport):
     """Test interaction between bot and user transports."""
@@ -41,8 +41,7 @@ class TestTransport(TelegramTransportBase):
         """Register a command handler."""
         self._command_handlers[command] = handler
 
-@pytest.mark.asyncio
-async def test_transport_base_is_abstract():
+def test_transport_base_is_abstract():
     """Test that TelegramTransportBase is abstract."""
     with pytest.raises(TypeError):
         TelegramTransportBase()
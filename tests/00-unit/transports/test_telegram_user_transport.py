@@ -1,8 +1,8 @@
 """Unit tests for TelegramUserTransport."""
 import pytest
-import pytest_asyncio
 from unittest.mock import MagicMock, AsyncMock, Mock, patch
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from telethon.errors.rpcerrorlist import ApiIdInvalidError
 
 from chronicler.frames.base import Frame
@@ -14,10 +14,11 @@ from chronicler.transports.telegram_user_update import TelegramUserUpdate
 from chronicler.transports.telegram_user_event import TelegramUserEvent
 from chronicler.exceptions import TransportError, TransportAuthenticationError
 from chronicler.logging import get_logger
+from tests.mocks.transports.telethon import create_mock_telethon
 
 logger = get_logger(__name__, component='test.transports.telegram')
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def mock_client():
     """Create a mock client."""
     mock = AsyncMock()
@@ -27,12 +28,12 @@ async def mock_client():
     mock.is_user_authorized = AsyncMock(return_value=True)
     mock.send_code_request = AsyncMock()
     mock.sign_in = AsyncMock()
-    mock.get_me = AsyncMock(return_value=Mock(id=123, first_name="Test User"))
+    mock.get_me = AsyncMock(return_value=SimpleNamespace(id=123, first_name="Test User"))
     mock.add_event_handler = AsyncMock()
     mock.run_until_disconnected = AsyncMock()
     return mock
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def transport(mock_client):
     """Create a transport instance with mock client."""
     with patch('chronicler.transports.telegram.transport.user.TelegramClient', return_value=mock_client):
@@ -55,8 +56,7 @@ async def transport(mock_client):
         if hasattr(transport, '_client') and transport._client:
             await transport._client.disconnect()
 
-@pytest.mark.asyncio
-async def test_user_transport_validates_params():
+def test_user_transport_validates_params():
     """Test parameter validation during initialization."""
     # All parameters empty
     with pytest.raises(TransportAuthenticationError, match="API ID, API hash and phone number cannot be empty"):
@@ -141,7 +141,7 @@ async def test_user_handle_text_message(mock_client):
     mock_client_instance.connect = AsyncMock(return_value=True)
     mock_client_instance.is_connected = AsyncMock(return_value=True)
     mock_client_instance.is_user_authorized = AsyncMock(return_value=True)
-    mock_client_instance.get_me = AsyncMock(return_value=Mock(id=123, first_name="Test User"))
+    mock_client_instance.get_me = AsyncMock(return_value=SimpleNamespace(id=123, first_name="Test User"))
     mock_client_instance.start = AsyncMock()
     mock_client.return_value = mock_client_instance
 
@@ -331,7 +331,7 @@ async def test_user_transport_lifecycle():
         mock_client.is_user_authorized = AsyncMock(return_value=True)
         mock_client.send_code_request = AsyncMock()
         mock_client.sign_in = AsyncMock()
-        mock_client.get_me = AsyncMock(return_value=Mock(id=123, first_name="Test User"))
+        mock_client.get_me = AsyncMock(return_value=SimpleNamespace(id=123, first_name="Test User"))
         mock_client.add_event_handler = AsyncMock()
         
         # Mock the start method to avoid actual client initialization
@@ -454,8 +454,7 @@ async def test_user_transport_command_processing(mock_client):
         await transport.register_command("/test", AsyncMock())
     assert str(exc_info.value) == "Command registration is no longer supported in Transport"
 
-@pytest.mark.asyncio
-async def test_user_event_handling():
+def test_user_event_handling():
     """Test TelegramUserEvent functionality."""
     # Create mock update
     mock_update = Mock()
@@ -508,4 +507,19 @@ async def test_user_event_handling():
     # Test with empty message
     mock_update.message_text = None
     event = TelegramUserEvent(mock_update)
-    assert event.get_command_args() == []
\ No newline at end of file
+    assert event.get_command_args() == []
+
+@pytest.mark.asyncio
+async def test_mock_telethon_clients_do_not_share_calls():
+    """Test that each mock Telethon client records only its own calls."""
+    first = create_mock_telethon()
+    second = create_mock_telethon()
+    assert first.send_message is not second.send_message
+
+    await second.connect()
+    assert not first.connect.called
+    second.connect.assert_awaited_once()
+
+    # Building another client must not wipe existing call history
+    create_mock_telethon()
+    second.connect.assert_awaited_once()
@@ -9,6 +9,30 @@ import logging
 from chronicler.storage.coordinator import StorageCoordinator
 from chronicler.storage.git import GitStorageAdapter
 
+def pytest_addoption(parser):
+    """Add command line options."""
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow (heavy transport mock setup)"
+    )
+
+# Fixtures that build the full mocked bot transport stack
+_SLOW_FIXTURES = frozenset({"mock_telegram_bot"})
+
+def pytest_collection_modifyitems(config, items):
+    """Mark tests using the mocked transport stack slow; skip them when --skip-slow is given."""
+    for item in items:
+        if _SLOW_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.slow)
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="--skip-slow given")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
@@ -23,22 +47,11 @@ def storage_path(temp_dir):
     storage_path.mkdir()
     return storage_path 
 
+def _no_op_configure(*args, **kwargs):
+    """Stand-in for configure_logging that leaves logging untouched."""
+
 @pytest.fixture(autouse=True)
-def disable_custom_logging():
+def disable_custom_logging(monkeypatch):
     """Disable custom logging configuration during tests."""
-    # Store original configure_logging function
-    from chronicler.logging.config import configure_logging
-    original_configure = configure_logging
-    
-    # Replace with no-op function
-    def no_op_configure(*args, **kwargs):
-        pass
-    
     from chronicler.logging import config
-    config.configure_logging = no_op_configure
-    
-    # Run the test
-    yield
-    
-    # Restore original function
-    config.configure_logging = original_configure 
\ No newline at end of file
+    monkeypatch.setattr(config, "configure_logging", _no_op_configure) 
\ No newline at end of file
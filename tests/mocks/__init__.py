@@ -1,25 +1,9 @@
 """Mock implementations for testing."""
+import importlib
 
-from .transports.telegram import (
-    MockUpdate,
-    bot_transport,
-    mock_telegram_bot
-)
-from .transports.telethon import (
-    create_mock_telethon,
-    mock_session_path,
-    mock_telethon,
-    mock_telegram_user_client,
-    user_transport
-)
+from .transports import __all__
 
-__all__ = [
-    'mock_session_path',
-    'mock_telethon',
-    'create_mock_telethon',
-    'MockUpdate',
-    'bot_transport',
-    'mock_telegram_bot',
-    'mock_telegram_user_client',
-    'user_transport'
-] 
\ No newline at end of file
+def __getattr__(name):
+    if name in __all__:
+        return getattr(importlib.import_module('.transports', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
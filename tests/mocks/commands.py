@@ -1,6 +1,6 @@
 """Mock implementations for command handlers."""
 import pytest
-from unittest.mock import AsyncMock, create_autospec
+from unittest.mock import AsyncMock, MagicMock
 
 from chronicler.frames.command import CommandFrame
 from chronicler.frames.media import TextFrame
@@ -13,25 +13,20 @@ TEST_METADATA = {"chat_id": 123}
 @pytest.fixture
 def command_handler_mock():
     """Create a mock command handler."""
-    handler = create_autospec(CommandHandler)
+    handler = MagicMock(spec=CommandHandler)
     handler.handle = AsyncMock(return_value=TextFrame(content="mock_handled", metadata={}))
     return handler
 
 @pytest.fixture
 def coordinator_mock():
     """Create a mock storage coordinator."""
-    mock = AsyncMock()
-    mock.is_initialized = AsyncMock()
-    mock.init_storage = AsyncMock()
-    mock.create_topic = AsyncMock()
-    mock.set_github_config = AsyncMock()
-    mock.sync = AsyncMock()
-    return mock
+    # AsyncMock creates its methods as AsyncMocks on first access
+    return AsyncMock()
 
 @pytest.fixture
 def start_handler_mock(coordinator_mock):
     """Create a mock StartCommandHandler."""
-    handler = create_autospec(CommandHandler)
+    handler = MagicMock(spec=CommandHandler)
     handler.command = "/start"
     handler.handle = AsyncMock(return_value=TextFrame(
         content="Storage initialized successfully!",
@@ -42,7 +37,7 @@ def start_handler_mock(coordinator_mock):
 @pytest.fixture
 def config_handler_mock(coordinator_mock):
     """Create a mock ConfigCommandHandler."""
-    handler = create_autospec(CommandHandler)
+    handler = MagicMock(spec=CommandHandler)
     handler.command = "/config"
     handler.handle = AsyncMock(return_value=TextFrame(
         content="GitHub configuration updated!",
@@ -53,7 +48,7 @@ def config_handler_mock(coordinator_mock):
 @pytest.fixture
 def status_handler_mock(coordinator_mock):
     """Create a mock StatusCommandHandler."""
-    handler = create_autospec(CommandHandler)
+    handler = MagicMock(spec=CommandHandler)
     handler.command = "/status"
     handler.handle = AsyncMock(return_value=TextFrame(
         content="Current status: initialized and configured",
@@ -1,12 +1,23 @@
 """Mock classes and fixtures for processor tests."""
 import pytest
 from unittest.mock import AsyncMock, Mock
+from chronicler.frames.base import Frame
 from chronicler.frames.command import CommandFrame
 from chronicler.frames.media import TextFrame
 from chronicler.handlers.command import CommandHandler
+from chronicler.processors.base import BaseProcessor
 from chronicler.storage.coordinator import StorageCoordinator
 from chronicler.commands.processor import CommandProcessor
 
+class MockProcessor(BaseProcessor):
+    """Lightweight processor stub with an AsyncMock process method."""
+    def __init__(self):
+        """Initialize mock processor without introspecting BaseProcessor."""
+        self.process = AsyncMock(return_value=TextFrame(content="mock_processed", metadata={}))
+
+    async def process(self, frame: Frame):
+        """Replaced per instance by an AsyncMock."""
+
 class TestCommandHandler(CommandHandler):
     """Test command handler implementation."""
     def __init__(self):
@@ -52,8 +63,4 @@ def storage_processor(storage):
 @pytest.fixture
 def processor_mock():
     """Create a mock processor factory."""
-    def create_mock():
-        processor = create_autospec(BaseProcessor)
-        processor.process = AsyncMock(return_value=TextFrame(content="mock_processed", metadata={}))
-        return processor
-    return create_mock 
\ No newline at end of file
+    return MockProcessor 
\ No newline at end of file
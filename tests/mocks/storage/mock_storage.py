@@ -9,7 +9,7 @@ class MockStorageCoordinator:
         self.base_path = base_path
         self.saved_messages = []
         self.saved_attachments = []
-        self.topics = {}
+        self.topics: dict[int, dict[str, dict]] = {}
         self.github_token = None
         self.github_repo = None
         
@@ -19,24 +19,24 @@ class MockStorageCoordinator:
         
     def create_topic(self, user_id: int, topic_name: str) -> None:
         """Create a new topic."""
-        self.topics[(user_id, topic_name)] = {
+        self.topics.setdefault(user_id, {})[topic_name] = {
             'messages': [],
             'attachments': []
         }
         
     def save_message(self, user_id: int, topic_name: str, message: dict) -> None:
         """Save a message to a topic."""
-        if (user_id, topic_name) not in self.topics:
+        if not self.topic_exists(user_id, topic_name):
             self.create_topic(user_id, topic_name)
         self.saved_messages.append((user_id, topic_name, message))
-        self.topics[(user_id, topic_name)]['messages'].append(message)
+        self.topics[user_id][topic_name]['messages'].append(message)
         
     def save_attachment(self, user_id: int, topic_name: str, file_path: str | Path, attachment_name: str) -> None:
         """Save an attachment."""
-        if (user_id, topic_name) not in self.topics:
+        if not self.topic_exists(user_id, topic_name):
             self.create_topic(user_id, topic_name)
         self.saved_attachments.append((user_id, topic_name, file_path, attachment_name))
-        self.topics[(user_id, topic_name)]['attachments'].append({
+        self.topics[user_id][topic_name]['attachments'].append({
             'path': str(file_path),
             'name': attachment_name
         })
@@ -52,4 +52,4 @@ class MockStorageCoordinator:
         
     def topic_exists(self, user_id: int, topic_name: str) -> bool:
         """Check if a topic exists."""
-        return (user_id, topic_name) in self.topics
\ No newline at end of file
+        return topic_name in self.topics.get(user_id, {})
\ No newline at end of file
@@ -1,20 +1,25 @@
-"""Transport mocks package."""
-from .telegram import MockUpdate, bot_transport, mock_telegram_bot
-from .telethon import (
-    create_mock_telethon,
-    mock_session_path,
-    mock_telethon,
-    mock_telegram_user_client,
-    user_transport
-)
+"""Transport mocks package.
 
-__all__ = [
-    'create_mock_telethon',
-    'MockUpdate',
-    'mock_session_path',
-    'mock_telethon',
-    'mock_telegram_user_client',
-    'user_transport',
-    'bot_transport',
-    'mock_telegram_bot'
-] 
\ No newline at end of file
+Submodules are imported on first attribute access (PEP 562) so that
+importing a sibling package such as ``tests.mocks.storage`` does not pull
+in telegram and telethon.
+"""
+import importlib
+
+_LAZY = {
+    'create_mock_telethon': '.telethon',
+    'MockUpdate': '.telegram',
+    'mock_session_path': '.telethon',
+    'mock_telethon': '.telethon',
+    'mock_telegram_user_client': '.telethon',
+    'user_transport': '.telethon',
+    'bot_transport': '.telegram',
+    'mock_telegram_bot': '.telegram'
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,14 @@
 """Mock implementations for Telegram transports."""
-import json
+import orjson
 import time
 import asyncio
+import functools
+import re
+from collections import defaultdict
+from types import SimpleNamespace
 import pytest
-import pytest_asyncio
-from unittest.mock import AsyncMock, Mock, call, MagicMock, patch
-from typing import Optional, Tuple, Dict, Any, List, Union
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
+from typing import Optional, Tuple, Dict
 from telegram.request import BaseRequest, RequestData
 from telegram.error import InvalidToken
 
@@ -13,25 +16,42 @@ from chronicler.logging import get_logger
 
 logger = get_logger(__name__)
 
+_GET_ME_RESULT = {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}
+_GET_ME_BYTES = orjson.dumps({"ok": True, "result": _GET_ME_RESULT})
+_INVALID_TOKEN_BYTES = orjson.dumps({"ok": False, "error": "The token `invalid_token` was rejected by the server."})
+_NOT_FOUND_BYTES = orjson.dumps({"ok": False, "error": "Not Found"})
+
+# Token substring -> (status, payload); "invalid_token" must be checked first
+_TOKEN_TABLE = (
+    ("invalid_token", (404, _INVALID_TOKEN_BYTES)),
+    ("test_token", (200, _GET_ME_BYTES)),
+)
+_NOT_FOUND_RESPONSE = (404, _NOT_FOUND_BYTES)
+
+# Bot API URLs look like https://api.telegram.org/bot<token>/<method>
+_TOKEN_RE = re.compile(r"/bot([^/]+)")
+_GET_ME_TOKEN_RE = re.compile(r"/bot([^/]+)/getMe")
+
+def _url_token(url: str) -> str:
+    """Extract the bot token from a Bot API URL, or "" if there is none."""
+    match = _TOKEN_RE.search(url)
+    return match.group(1) if match else ""
+
 class MockUpdate:
     """Mock Telegram Update object."""
     
     def __init__(self, message_text=None, chat_id=None, chat_title=None, 
                  sender_id=None, sender_name=None, message_id=None, thread_id=None):
         """Initialize mock update."""
-        self.message = Mock()
-        self.message.text = message_text
-        self.message.chat = Mock()
-        self.message.chat.id = chat_id or 123456789
-        self.message.chat.title = chat_title or "Test Chat"
-        self.message.chat.type = "private"
-        self.message.from_user = Mock()
-        self.message.from_user.id = sender_id or 987654321
-        self.message.from_user.username = sender_name or "test_user"
-        self.message.message_id = message_id or 1
-        self.message.message_thread_id = thread_id
-        self.message.date = Mock()
-        self.message.date.timestamp = Mock(return_value=time.time())
+        timestamp = time.time()
+        self.message = SimpleNamespace(
+            text=message_text,
+            chat=SimpleNamespace(id=chat_id or 123456789, title=chat_title or "Test Chat", type="private"),
+            from_user=SimpleNamespace(id=sender_id or 987654321, username=sender_name or "test_user"),
+            message_id=message_id or 1,
+            message_thread_id=thread_id,
+            date=SimpleNamespace(timestamp=lambda: timestamp),
+        )
 
 class MockHTTPXRequest(BaseRequest):
     """Mock request handler for testing."""
@@ -55,12 +75,10 @@ class MockHTTPXRequest(BaseRequest):
         pool_timeout: Optional[float] = None,
     ) -> bytes:
         """Mock request wrapper that validates token."""
-        if "invalid_token" in url:
-            raise InvalidToken("Token validation failed")
-        elif "test_token" in url:
-            return json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
-        else:
-            raise InvalidToken("Not Found")
+        status, payload = await self.do_request(url, method)
+        if status == 200:
+            return payload
+        raise InvalidToken("Token validation failed" if payload is _INVALID_TOKEN_BYTES else "Not Found")
 
     async def do_request(
         self,
@@ -73,16 +91,12 @@ class MockHTTPXRequest(BaseRequest):
         pool_timeout: Optional[float] = None,
     ) -> Tuple[int, bytes]:
         """Mock request that validates token."""
-        if "invalid_token" in url:
-            return 404, json.dumps({"ok": False, "error": "The token `invalid_token` was rejected by the server."}).encode()
-        elif "test_token" in url:
-            return 200, json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
-        else:
-            return 404, json.dumps({"ok": False, "error": "Not Found"}).encode()
+        token = _url_token(url)
+        return next((response for key, response in _TOKEN_TABLE if key in token), _NOT_FOUND_RESPONSE)
 
     def parse_json_payload(self, payload: bytes) -> Dict:
         """Parse JSON payload."""
-        return json.loads(payload.decode())
+        return orjson.loads(payload)
 
     async def post(
         self,
@@ -94,12 +108,15 @@ class MockHTTPXRequest(BaseRequest):
         pool_timeout: Optional[float] = None,
     ) -> bytes:
         """Mock post request that validates token."""
-        if "invalid_token" in url:
-            raise InvalidToken("The token `invalid_token` was rejected by the server.")
-        elif "test_token" in url:
-            return json.dumps({"ok": True, "result": {"id": 123456789, "is_bot": True, "first_name": "Test Bot", "username": "test_bot", "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False}}).encode()
-        else:
-            raise InvalidToken("Not Found")
+        status, payload = await self.do_request(url, "POST")
+        if status == 200:
+            return payload
+        raise InvalidToken(
+            "The token `invalid_token` was rejected by the server." if payload is _INVALID_TOKEN_BYTES else "Not Found"
+        )
+
+# MockHTTPXRequest holds no per-bot state, so every MockBot shares one instance
+_SHARED_REQUEST = MockHTTPXRequest()
 
 # Patch httpx.AsyncClient before any imports
 class MockAsyncClient:
@@ -108,17 +125,10 @@ class MockAsyncClient:
         self.timeout = Mock(read=None, write=None, connect=None, pool=None)
 
     async def request(self, method, url, **kwargs):
-        if "invalid_token" in url:
-            return MockResponse(404, b'{"ok":false,"error_code":404,"description":"Not Found"}')
-        elif "valid_token" in url:
-            return MockResponse(200, b'{"ok":true,"result":{"id":123,"first_name":"Valid Bot","username":"valid_bot","can_join_groups":true,"can_read_all_group_messages":false,"supports_inline_queries":false,"is_bot":true}}')
-        elif "test_token" in url:
-            return MockResponse(200, b'{"ok":true,"result":{"id":123,"first_name":"Test Bot","username":"test_bot","can_join_groups":true,"can_read_all_group_messages":false,"supports_inline_queries":false,"is_bot":true}}')
-        else:
-            return MockResponse(404, b'{"ok":false,"error_code":404,"description":"Not Found"}')
+        return _client_response(_url_token(url))
 
     async def post(self, url, **kwargs):
-        return await self.request("POST", url, **kwargs)
+        return _client_response(_url_token(url))
 
     async def aclose(self):
         self.is_closed = True
@@ -128,42 +138,57 @@ class MockResponse:
         self.status_code = status_code
         self.content = content
 
-# Patch httpx.AsyncClient before importing telegram
-import httpx
-httpx.AsyncClient = MockAsyncClient
+# Responses are read-only in tests, so a single instance of each is shared
+_CLIENT_NOT_FOUND = MockResponse(404, b'{"ok":false,"error_code":404,"description":"Not Found"}')
+_CLIENT_VALID_BOT = MockResponse(200, b'{"ok":true,"result":{"id":123,"first_name":"Valid Bot","username":"valid_bot","can_join_groups":true,"can_read_all_group_messages":false,"supports_inline_queries":false,"is_bot":true}}')
+_CLIENT_TEST_BOT = MockResponse(200, b'{"ok":true,"result":{"id":123,"first_name":"Test Bot","username":"test_bot","can_join_groups":true,"can_read_all_group_messages":false,"supports_inline_queries":false,"is_bot":true}}')
 
-from telegram.ext import ApplicationBuilder, CommandHandler, ExtBot, Application
-from telegram.error import InvalidToken
-from telegram.request import RequestData
-from telegram import Bot, Message, Chat, PhotoSize, User
-from collections import defaultdict
-
-from chronicler.exceptions import (
-    TransportError, 
-    TransportAuthenticationError,
-    TransportConnectionError,
-    TransportMessageError
+# Token substring -> response; "invalid_token" must be checked before "valid_token"
+_CLIENT_TOKEN_TABLE = (
+    ("invalid_token", _CLIENT_NOT_FOUND),
+    ("valid_token", _CLIENT_VALID_BOT),
+    ("test_token", _CLIENT_TEST_BOT),
 )
-from chronicler.frames import CommandFrame
-from chronicler.transports.events import EventMetadata
-from chronicler.transports.telegram.transport.bot import TelegramBotTransport
-from chronicler.transports.telegram_bot_event import TelegramBotEvent
 
-from telegram.error import InvalidToken
+@functools.lru_cache(maxsize=16)
+def _client_response(token: str) -> MockResponse:
+    """Resolve the shared MockAsyncClient response for a bot token."""
+    return next((response for key, response in _CLIENT_TOKEN_TABLE if key in token), _CLIENT_NOT_FOUND)
+
+# Patch httpx.AsyncClient before telegram.ext is imported; guarded so that a second
+# import of this module (e.g. under another name) does not re-patch it
+import httpx
+if not getattr(httpx, "_mock_async_client_installed", False):
+    httpx.AsyncClient = MockAsyncClient
+    httpx._mock_async_client_installed = True
+
 from chronicler.exceptions import TransportError, TransportAuthenticationError
 
+@functools.lru_cache(maxsize=None)
+def _bot_module():
+    """Import the bot transport module once, on first fixture use."""
+    import chronicler.transports.telegram.transport.bot as bot_module
+    return bot_module
+
+def _transport_cls():
+    """Return TelegramBotTransport without importing it at collection time."""
+    return _bot_module().TelegramBotTransport
+
 class MockBot:
     """Mock Telegram bot."""
 
+    # Send coroutines that tests assert on; each instance gets fresh mocks
+    _ASYNC_ATTRS = ("send_message", "send_photo")
+
     def __init__(self, token):
         """Initialize mock bot."""
         self.token = token
         self._message_id = 0
         self._command_handlers = {}
         self._initialized = False
-        self.send_message = AsyncMock()
-        self.send_photo = AsyncMock()
-        self._request = [MockHTTPXRequest(), MockHTTPXRequest()]  # Bot uses two request objects
+        for attr in self._ASYNC_ATTRS:
+            setattr(self, attr, AsyncMock(name=f"bot.{attr}"))
+        self._request = [_SHARED_REQUEST, _SHARED_REQUEST]  # Bot uses two request objects
         self._app = None
         self.logger = get_logger(f"{__name__}.MockBot")
 
@@ -175,7 +200,8 @@ class MockBot:
         """
         if not self._initialized:
             self.logger.debug("Initializing bot")
-            await asyncio.gather(self._request[0].initialize(), self._request[1].initialize())
+            await self._request[0].initialize()
+            await self._request[1].initialize()
             if self.token == "invalid_token":
                 raise InvalidToken("The token `invalid_token` was rejected by the server.")
             if not self.token:
@@ -191,7 +217,7 @@ class MockBot:
             # Special case for test_token to avoid initialization check
             raise InvalidToken("Bot must be initialized first")
         result = await self._request[0].post(f"https://api.telegram.org/bot{self.token}/getMe")
-        return json.loads(result.decode())["result"]
+        return orjson.loads(result)["result"]
 
     def _create_message(self, text, chat_id=None, message_id=None):
         """Create a mock message."""
@@ -222,11 +248,15 @@ class MockBot:
             raise ValueError("Handler cannot be empty")
         self._command_handlers[command] = handler
         if self._app:
+            from telegram.ext import CommandHandler
             await self._app.add_handler(CommandHandler(command, handler))
 
 class MockApplication:
     """Mock Application class for testing."""
 
+    # Lifecycle coroutines that tests assert on; created per instance on first access
+    _ASYNC_ATTRS = frozenset(("_start", "stop", "shutdown"))
+
     def __init__(self):
         """Initialize mock application."""
         self.signal_handlers = []
@@ -234,10 +264,15 @@ class MockApplication:
         self._initialized = False
         self._bot = None
         self.logger = get_logger(f"{__name__}.MockApplication")
-        self.handlers = [[]]  # Initialize with an empty list for the first update handler group
-        self._start = AsyncMock()  # Make start an AsyncMock
-        self.stop = AsyncMock()  # Make stop an AsyncMock
-        self.shutdown = AsyncMock()  # Make shutdown an AsyncMock
+        self.handlers = defaultdict(list)  # Handler group -> handlers, like Application.handlers
+
+    def __getattr__(self, name):
+        """Create lifecycle mocks lazily so unused ones are never built."""
+        if name not in self._ASYNC_ATTRS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = AsyncMock(name=f"app.{name.lstrip('_')}")
+        self.__dict__[name] = value
+        return value
 
     @property
     def start(self):
@@ -275,17 +310,12 @@ class MockApplication:
     async def add_handler(self, handler, group=None):
         """Add a handler to the application."""
         self.logger.debug("Adding handler to application")
-        if group is None:
-            group = 0
-        # Ensure we have enough groups
-        while len(self.handlers) <= group:
-            self.handlers.append([])
-        self.handlers[group].append(handler)
+        self.handlers[group or 0].append(handler)
         self.logger.debug("Handler added successfully")
 
     def add_signal_handler(self, signal, handler):
         """Add a signal handler to the application."""
-        self.logger.debug(f"Adding signal handler for signal {signal}")
+        self.logger.debug("Adding signal handler for signal %s", signal)
         self.signal_handlers.append((signal, handler))
         self.logger.debug("Signal handler added successfully")
 
@@ -306,7 +336,7 @@ class MockApplicationBuilder:
         Raises:
             InvalidToken: If token is invalid
         """
-        self.logger.debug(f"Setting token: {token}")
+        self.logger.debug("Setting token: %s", token)
         if token == "invalid_token":
             self.logger.error("Invalid token provided")
             raise InvalidToken("Token validation failed")
@@ -338,45 +368,40 @@ class MockApplicationBuilder:
         return app
 
 @pytest.fixture
-def mock_telegram_bot(monkeypatch):
+def mock_telegram_bot():
     """Create a mock telegram bot with application for testing."""
     logger = get_logger(f"{__name__}.fixture")
     logger.debug("Setting up mock telegram bot")
     
-    # Patch ApplicationBuilder and Application in the transport module
-    monkeypatch.setattr('chronicler.transports.telegram.transport.bot.ApplicationBuilder', MockApplicationBuilder)
-    monkeypatch.setattr('chronicler.transports.telegram.transport.bot.Application', MockApplication)
+    from chronicler.commands.processor import CommandProcessor
+    from chronicler.pipeline.pipeline import Pipeline
     
-    stop_event = asyncio.Event()
-    
-    # Create transport
-    transport = TelegramBotTransport("test_token")
-    
-    # Set up bot
-    bot = MockBot("test_token")
-    bot.send_message = AsyncMock()
-    bot.send_photo = AsyncMock()
-    bot._command_handlers = {}
-    
-    # Return all components
-    return {
-        'transport': transport,
-        'bot': bot,
-        'cmd_proc': AsyncMock(),
-        'pipeline': AsyncMock(),
-        'stop_event': stop_event,
-    }
+    # Patch ApplicationBuilder and Application in the transport module in one step
+    with patch.multiple(_bot_module(), ApplicationBuilder=MockApplicationBuilder, Application=MockApplication):
+        stop_event = asyncio.Event()
+        
+        # Create transport
+        transport = _transport_cls()("test_token")
+        
+        # Set up bot; MockBot already provides fresh send mocks and handler registry
+        bot = MockBot("test_token")
+        
+        # Yield all components
+        yield {
+            'transport': transport,
+            'bot': bot,
+            'cmd_proc': AsyncMock(name="cmd_proc", spec_set=CommandProcessor),
+            'pipeline': AsyncMock(name="pipeline", spec_set=Pipeline),
+            'stop_event': stop_event,
+        }
 
-@pytest_asyncio.fixture
-async def bot_transport(mock_telegram_bot, monkeypatch):
+@pytest.fixture
+async def bot_transport(mock_telegram_bot):
     """Create a bot transport instance."""
-    # Patch the ApplicationBuilder and Application
-    monkeypatch.setattr('chronicler.transports.telegram.transport.bot.ApplicationBuilder', MockApplicationBuilder)
-    monkeypatch.setattr('chronicler.transports.telegram.transport.bot.Application', MockApplication)
-    
+    # ApplicationBuilder and Application are already patched by mock_telegram_bot
     # Use real event loop for this test
     mock_telegram_bot['loop'] = asyncio.get_running_loop()
-    transport = TelegramBotTransport(token="test_token")
+    transport = _transport_cls()(token="test_token")
     await transport.authenticate()  # This will initialize the bot properly
     
     # Set up message sender
@@ -386,13 +411,17 @@ async def bot_transport(mock_telegram_bot, monkeypatch):
     
     return transport
 
+async def _mock_do_request(url, method):
+    """Answer getMe by token and anything else with a bare OK; each call gets fresh payloads."""
+    match = _GET_ME_TOKEN_RE.search(url)
+    if not match:
+        return 200, {"ok": True}
+    if match.group(1) == "test_token":
+        return 200, {"ok": True, "result": {"id": 123, "first_name": "Test Bot", "username": "test_bot"}}
+    return 401, {"ok": False, "error_code": 401, "description": "Unauthorized"}
+
 @pytest.fixture
 def mock_http_request():
-    """Mock HTTP request for testing."""
-    return MockHTTPXRequest()
-
-@pytest_asyncio.fixture
-async def mock_http_request():
     """Mock HTTP request for testing."""
     # Create mock request
     mock_request = AsyncMock()
@@ -400,15 +429,7 @@ async def mock_http_request():
     mock_request.shutdown = AsyncMock()
 
     # Mock do_request to validate tokens
-    async def mock_do_request(url, method):
-        if "getMe" in url:
-            token = url.split("/bot")[1].split("/")[0]
-            if token == "test_token":
-                return 200, {"ok": True, "result": {"id": 123, "first_name": "Test Bot", "username": "test_bot"}}
-            return 401, {"ok": False, "error_code": 401, "description": "Unauthorized"}
-        return 200, {"ok": True}
-
-    mock_request.do_request = AsyncMock(side_effect=mock_do_request)
+    mock_request.do_request = AsyncMock(side_effect=_mock_do_request)
     return mock_request
 
 @pytest.fixture
@@ -421,60 +442,49 @@ def assert_transport_error_async():
             post_error_assertions()
     return _assert_transport_error_async 
 
-@pytest_asyncio.fixture
+async def _mock_authenticate(transport):
+    """Authenticate a mocked transport, rejecting the invalid test token."""
+    if transport._token == "invalid_token":
+        transport._initialized = False
+        raise TransportAuthenticationError("Token validation failed")
+    transport._initialized = True
+
+def _call_signal_handler(sig, callback):
+    """Invoke a registered signal handler immediately."""
+    callback()
+
+@pytest.fixture
 async def mock_bot_runner(mock_telegram_bot, coordinator_mock):
     """Create a mock bot runner setup with all required components."""
-    # Create mock transport
-    mock_transport = TelegramBotTransport("test_token")
-    mock_transport._app = mock_telegram_bot['app']
-    mock_transport._bot = mock_telegram_bot['app'].bot
+    # Create mock transport around a mocked application
+    mock_transport = _transport_cls()("test_token")
+    mock_transport._app = MockApplicationBuilder().token("test_token").build()
+    mock_transport._bot = mock_transport._app.bot
     mock_transport._initialized = True  # Set _initialized instead of is_running
-    mock_transport.authenticate = AsyncMock()  # Add authenticate method
+    mock_transport.authenticate = AsyncMock(side_effect=functools.partial(_mock_authenticate, mock_transport))
     mock_transport.start = AsyncMock()  # Add start method
     mock_transport.stop = AsyncMock()  # Add stop method
 
-    # Mock storage using coordinator_mock
+    # Mock storage using coordinator_mock; AsyncMock children are created on access
     mock_storage = AsyncMock()
-    mock_storage.start = AsyncMock()
-    mock_storage.stop = AsyncMock()
     mock_storage.coordinator = coordinator_mock
-    mock_storage.is_initialized = AsyncMock(return_value=False)  # Add is_initialized method
-    mock_storage.init_storage = AsyncMock()  # Add init_storage method
-    mock_storage.create_topic = AsyncMock()  # Add create_topic method
-    mock_storage.save_message = AsyncMock()  # Add save_message method
+    mock_storage.is_initialized.return_value = False
 
     # Mock command processor
     mock_cmd_proc = AsyncMock()
     mock_cmd_proc.register_handler = MagicMock()  # Not async
-    mock_cmd_proc.start = AsyncMock()
-    mock_cmd_proc.stop = AsyncMock()
-    mock_cmd_proc.process = AsyncMock()  # Add process method
 
     # Mock pipeline
     mock_pipeline = AsyncMock()
     mock_pipeline.add_processor = MagicMock()  # Not async
-    mock_pipeline.start = AsyncMock()
-    mock_pipeline.stop = AsyncMock()
-    mock_pipeline.process = AsyncMock()
 
-    # Create a stop event that's already set
+    # Stop event is already set so the runner returns immediately
     stop_event = asyncio.Event()
     stop_event.set()
 
-    # Mock event loop
+    # Mock event loop that fires signal handlers immediately
     mock_loop = MagicMock()
-    def add_signal_handler(sig, callback):
-        callback()  # Call the handler immediately
-    mock_loop.add_signal_handler = MagicMock(side_effect=add_signal_handler)
-
-    # Set up error handling for invalid token
-    async def mock_authenticate():
-        if mock_transport.token == "invalid_token":
-            mock_transport._initialized = False
-            raise TransportAuthenticationError("Token validation failed")
-        mock_transport._initialized = True
-        return None
-    mock_transport.authenticate.side_effect = mock_authenticate
+    mock_loop.add_signal_handler = MagicMock(side_effect=_call_signal_handler)
 
     # Return all mocks in a dict for easy access
     return {
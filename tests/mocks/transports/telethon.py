@@ -1,24 +1,33 @@
 """Mock implementations for Telethon client."""
 import pytest
-import pytest_asyncio
 import os
-from unittest.mock import AsyncMock, Mock, call, MagicMock, patch
-from telegram.ext import ApplicationBuilder, CommandHandler, ExtBot, Application
-from telegram.error import InvalidToken
-from typing import Optional, Tuple, Dict
-from telegram.request import RequestData, BaseRequest
-import json
-from telegram import Bot
-import asyncio
+import functools
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 
-from chronicler.exceptions import TransportError
-from chronicler.frames import CommandFrame
-from chronicler.transports.events import EventMetadata
-from chronicler.transports.telegram.transport.bot import TelegramBotTransport
-from chronicler.transports.telegram_bot_event import TelegramBotEvent
-from chronicler.transports.telegram.transport.user import TelegramUserTransport
+@functools.lru_cache(maxsize=None)
+def _user_module():
+    """Import the user transport module (and telethon) once, on first fixture use."""
+    import chronicler.transports.telegram.transport.user as user_module
+    return user_module
 
-from telethon import events
+class _OnRecorder:
+    """Per-client stand-in for ``client.on`` that records the registered handler."""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client):
+        self.client = client
+
+    def __call__(self, event_type):
+        return self.register_handler
+
+    def register_handler(self, handler):
+        # Store event handler for testing
+        self.client._event_handler = handler
+        # Create a simple async mock that stores the handler
+        mock_handler = AsyncMock()
+        mock_handler.__real_handler__ = handler
+        return mock_handler
 
 def create_mock_telethon():
     """Create a mock Telethon client for user transport testing."""
@@ -33,28 +42,15 @@ def create_mock_telethon():
     client.send_file = AsyncMock()
     
     # Mock event registration
-    event_handler = None
-    def on_mock(event_type):
-        nonlocal event_handler
-        def register_handler(handler):
-            nonlocal event_handler
-            event_handler = handler
-            # Create a simple async mock that stores the handler
-            mock_handler = AsyncMock()
-            mock_handler.__real_handler__ = handler
-            return mock_handler
-        return register_handler
-    client.on = Mock(side_effect=on_mock)
-    
-    # Store event handler for testing
-    client._event_handler = event_handler
+    client._event_handler = None
+    client.on = Mock(side_effect=_OnRecorder(client))
     
     return client
 
-@pytest_asyncio.fixture
-async def mock_session_path(tmp_path):
-    """Mock session path for testing."""
-    return tmp_path / "test_session"
+@pytest.fixture(scope="session")
+def mock_session_path(tmp_path_factory):
+    """Mock session path for testing; only a path, so it is shared across the session."""
+    return tmp_path_factory.mktemp("telethon") / "test_session"
 
 @pytest.fixture
 def mock_telethon(mock_session_path):
@@ -70,18 +66,19 @@ def mock_telethon(mock_session_path):
         mock.return_value = client
         yield mock
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def mock_telegram_user_client():
     """Create a mock Telethon client for testing."""
     return create_mock_telethon()
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def user_transport(mock_telegram_user_client, monkeypatch):
     """Create a user transport instance."""
     # Patch TelegramClient to return our mock
-    monkeypatch.setattr('chronicler.transports.telegram.transport.user.TelegramClient', Mock(return_value=mock_telegram_user_client))
+    user_module = _user_module()
+    monkeypatch.setattr(user_module, 'TelegramClient', Mock(return_value=mock_telegram_user_client))
     
-    transport = TelegramUserTransport(
+    transport = user_module.TelegramUserTransport(
         api_id=123456789,
         api_hash="test_hash",
         phone_number="+1234567890"